@@ -20,6 +20,8 @@ from typing import IO, Union
 import fsspec
 import torch
 
+_TORCH_1_6_0 = LooseVersion(torch.__version__).version[:3] == [1, 6, 0]
+
 
 def load(path_or_url: Union[str, IO, Path], map_location=None):
     if not isinstance(path_or_url, (str, Path)):
@@ -57,7 +59,7 @@ def atomic_save(checkpoint, filepath: str):
     # Can't use the new zipfile serialization for 1.6.0 because there's a bug in
     # torch.hub.load_state_dict_from_url() that prevents it from loading the new files.
     # More details can be found here: https://github.com/pytorch/pytorch/issues/42239
-    if LooseVersion(torch.__version__).version[:3] == [1, 6, 0]:
+    if _TORCH_1_6_0:
         torch.save(checkpoint, bytesbuffer, _use_new_zipfile_serialization=False)
     else:
         torch.save(checkpoint, bytesbuffer)
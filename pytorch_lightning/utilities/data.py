@@ -18,6 +18,8 @@ from torch.utils.data import DataLoader, IterableDataset
 
 from pytorch_lightning.utilities import rank_zero_warn
 
+_TORCH_GREATER_EQUAL_1_4 = LooseVersion(torch.__version__) >= LooseVersion("1.4.0")
+
 
 def has_iterable_dataset(dataloader: DataLoader):
     return hasattr(dataloader, 'dataset') and isinstance(dataloader.dataset, IterableDataset)
@@ -38,7 +40,7 @@ def has_len(dataloader: DataLoader) -> bool:
     except NotImplementedError:  # e.g. raised by torchtext if a batch_size_fn is used
         has_len = False
 
-    if has_len and has_iterable_dataset(dataloader) and LooseVersion(torch.__version__) >= LooseVersion("1.4.0"):
+    if has_len and has_iterable_dataset(dataloader) and _TORCH_GREATER_EQUAL_1_4:
         rank_zero_warn(
             'Your `IterableDataset` has `__len__` defined.'
             ' In combination with multi-processing data loading (e.g. batch size > 1),'